@@ -1,9 +1,11 @@
 """Product Analyst Tools for extracting and analyzing product information."""
 
+import functools
 import os
 import re
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from urllib.parse import urlparse
 
 from crewai.tools import BaseTool
@@ -12,6 +14,13 @@ import PyPDF2
 import docx
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import fitz  # PyMuPDF: C-backed text extraction, much faster than PyPDF2
+except ImportError:
+    fitz = None
 
 
 class ProductInfo(BaseModel):
@@ -72,16 +81,23 @@ class DocumentParserTool(BaseTool):
             return f"Error parsing document: {str(e)}"
     
     def _parse_pdf(self, path: Path) -> str:
-        """Extract text from PDF file."""
+        """Extract text from PDF file (PyMuPDF when installed, else PyPDF2)."""
         text_content = []
         
-        with open(path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            
-            for page_num, page in enumerate(pdf_reader.pages):
-                text = page.extract_text()
-                if text.strip():
-                    text_content.append(f"--- Page {page_num + 1} ---\n{text}")
+        if fitz is not None:
+            with fitz.open(path) as pdf:
+                for page_num, page in enumerate(pdf):
+                    text = page.get_text("text")
+                    if text.strip():
+                        text_content.append(f"--- Page {page_num + 1} ---\n{text}")
+        else:
+            with open(path, 'rb') as file:
+                pdf_reader = PyPDF2.PdfReader(file)
+                
+                for page_num, page in enumerate(pdf_reader.pages):
+                    text = page.extract_text()
+                    if text.strip():
+                        text_content.append(f"--- Page {page_num + 1} ---\n{text}")
         
         return "\n\n".join(text_content)
     
@@ -89,10 +105,8 @@ class DocumentParserTool(BaseTool):
         """Extract text from DOCX file."""
         doc = docx.Document(path)
         
-        text_content = []
-        for para in doc.paragraphs:
-            if para.text.strip():
-                text_content.append(para.text)
+        # Paragraph.text re-assembles the runs on every access, so read it once
+        text_content = [text for text in (para.text for para in doc.paragraphs) if text.strip()]
         
         # Also extract text from tables
         for table in doc.tables:
@@ -108,6 +122,44 @@ class DocumentParserTool(BaseTool):
             return file.read()
 
 
+# Compiled once at import; WebScraperTool reuses them for every page
+_CONTENT_CLASS_RE = re.compile('content|main')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
+# Headers to mimic a browser request
+_SCRAPER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+
+def _build_scraper_session() -> requests.Session:
+    """Create the shared HTTP session used by WebScraperTool.
+    
+    Keep-alive connections (and TLS sessions) are pooled per host, so repeated
+    scrapes of the same site skip the TCP/TLS handshake. Failed connection
+    attempts are retried with backoff; read timeouts are not retried so a slow
+    page still fails after a single timeout.
+    """
+    session = requests.Session()
+    session.headers.update(_SCRAPER_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, read=False, backoff_factor=0.3),
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+_SESSION = _build_scraper_session()
+
+# Largest response body WebScraperTool reads; bigger pages are truncated
+_MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+
 class WebScraperTool(BaseTool):
     """Tool for scraping product information from websites."""
     
@@ -134,19 +186,22 @@ class WebScraperTool(BaseTool):
             if not parsed_url.scheme or not parsed_url.netloc:
                 return f"Error: Invalid URL format: {url}"
             
-            # Set headers to mimic browser request
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-            }
-            
-            # Fetch the page
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
+            # Fetch the page over the shared, pooled session, streaming the body
+            # so an oversized page is cut off at _MAX_PAGE_BYTES
+            with _SESSION.get(url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                chunks = []
+                size = 0
+                for chunk in response.iter_content(chunk_size=65536):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size > _MAX_PAGE_BYTES:
+                        break
+            truncated = size > _MAX_PAGE_BYTES
+            page = b"".join(chunks)[:_MAX_PAGE_BYTES]
             
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Parse with BeautifulSoup on the lxml (libxml2) tree builder
+            soup = BeautifulSoup(page, 'lxml')
             
             # Remove script, style, and nav elements
             for tag in soup(['script', 'style', 'nav', 'footer', 'header']):
@@ -162,7 +217,7 @@ class WebScraperTool(BaseTool):
             
             # Extract main content
             # Try to find main content area
-            main_content = soup.find('main') or soup.find('article') or soup.find('div', class_=re.compile('content|main'))
+            main_content = soup.find('main') or soup.find('article') or soup.find('div', class_=_CONTENT_CLASS_RE)
             
             if main_content:
                 text_content = main_content.get_text(separator='\n', strip=True)
@@ -171,13 +226,15 @@ class WebScraperTool(BaseTool):
                 text_content = soup.body.get_text(separator='\n', strip=True) if soup.body else ""
             
             # Clean up excessive whitespace
-            text_content = re.sub(r'\n\s*\n', '\n\n', text_content)
+            text_content = _BLANK_LINES_RE.sub('\n\n', text_content)
             
             result = f"URL: {url}\n"
             if title_text:
                 result += f"Title: {title_text}\n"
             if description:
                 result += f"Description: {description}\n"
+            if truncated:
+                result += f"Note: Page truncated to the first {_MAX_PAGE_BYTES // (1024 * 1024)} MB\n"
             result += f"\n--- Content ---\n{text_content}"
             
             return result
@@ -190,6 +247,39 @@ class WebScraperTool(BaseTool):
             return f"Error: Failed to parse content from {url}: {str(e)}"
 
 
+# Section patterns for ProductAnalyzerTool, compiled once at import. Every bulleted
+# section heading is one alternative; the named group that matched gives the
+# ProductInfo list the bullets belong to.
+_SECTION_KINDS = ('features', 'benefits', 'use_cases')
+_SECTION_RE = re.compile(
+    r'(?:'
+    r'(?P<features>(?:feature|capability|functionality)s?|what it does|key features|main features)'
+    r'|(?P<benefits>(?:benefit|advantage|value)s?|why choose|why use|advantages)'
+    r'|(?P<use_cases>(?:use case|application|scenario)s?|who can use|ideal for|perfect for)'
+    r'):?\s*\n(?P<body>(?:[-•*]\s*.+\n?)+)',
+    re.IGNORECASE | re.MULTILINE,
+)
+_BULLET_RE = re.compile(r'[-•*]\s*(.+)')
+_TARGET_MARKET_KEYWORDS = (
+    'enterprise', 'small business', 'startup', 'b2b', 'b2c',
+    'developers', 'marketers', 'sales teams', 'managers',
+    'professionals', 'individuals', 'organizations'
+)
+# Lookahead so overlapping keywords (e.g. "b2b2c") are all found in one sweep
+_TARGET_MARKET_RE = re.compile('(?=(' + '|'.join(map(re.escape, _TARGET_MARKET_KEYWORDS)) + '))')
+_PRICING_PATTERNS = (
+    re.compile(r'\$\d+(?:,\d{3})*(?:\.\d{2})?(?:/month|/mo|/year|/yr)?', re.IGNORECASE),
+    re.compile(r'(?:free|freemium|subscription|license)', re.IGNORECASE),
+    re.compile(r'(?:pricing|price|cost):?\s*(.+)', re.IGNORECASE),
+)
+_SPEC_PATTERNS = {
+    'platform': re.compile(r'(?:platform|os|operating system):?\s*([^\n]+)', re.IGNORECASE),
+    'languages': re.compile(r'(?:languages?|programming languages?):?\s*([^\n]+)', re.IGNORECASE),
+    'integration': re.compile(r'(?:integrates? with|supports?):?\s*([^\n]+)', re.IGNORECASE),
+    'api': re.compile(r'(?:api|rest api|graphql):?\s*([^\n]+)', re.IGNORECASE),
+}
+
+
 class ProductAnalyzerTool(BaseTool):
     """Tool for analyzing and structuring product information from raw content."""
     
@@ -222,97 +312,46 @@ class ProductAnalyzerTool(BaseTool):
                     break
         
         # Pattern matching for common sections
-        self._extract_features(content, product_info)
-        self._extract_benefits(content, product_info)
-        self._extract_use_cases(content, product_info)
+        self._extract_sections(content, product_info)
         self._extract_target_market(content, product_info)
         self._extract_pricing(content, product_info)
         self._extract_technical_specs(content, product_info)
         
+        # Drop bullets repeated within each section list, keeping first-seen order
+        product_info.features = list(dict.fromkeys(product_info.features))
+        product_info.benefits = list(dict.fromkeys(product_info.benefits))
+        product_info.use_cases = list(dict.fromkeys(product_info.use_cases))
+        
         # Format output
         result = self._format_product_info(product_info)
         return result
     
-    def _extract_features(self, content: str, product_info: ProductInfo):
-        """Extract product features from content."""
-        patterns = [
-            r'(?:feature|capability|functionality)s?:?\s*\n((?:[-•*]\s*.+\n?)+)',
-            r'(?:what it does|key features|main features):?\s*\n((?:[-•*]\s*.+\n?)+)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                items = re.findall(r'[-•*]\s*(.+)', match.group(1))
-                product_info.features.extend([item.strip() for item in items if item.strip()])
-    
-    def _extract_benefits(self, content: str, product_info: ProductInfo):
-        """Extract product benefits from content."""
-        patterns = [
-            r'(?:benefit|advantage|value)s?:?\s*\n((?:[-•*]\s*.+\n?)+)',
-            r'(?:why choose|why use|advantages):?\s*\n((?:[-•*]\s*.+\n?)+)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                items = re.findall(r'[-•*]\s*(.+)', match.group(1))
-                product_info.benefits.extend([item.strip() for item in items if item.strip()])
-    
-    def _extract_use_cases(self, content: str, product_info: ProductInfo):
-        """Extract use cases from content."""
-        patterns = [
-            r'(?:use case|application|scenario)s?:?\s*\n((?:[-•*]\s*.+\n?)+)',
-            r'(?:who can use|ideal for|perfect for):?\s*\n((?:[-•*]\s*.+\n?)+)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                items = re.findall(r'[-•*]\s*(.+)', match.group(1))
-                product_info.use_cases.extend([item.strip() for item in items if item.strip()])
+    def _extract_sections(self, content: str, product_info: ProductInfo):
+        """Extract features, benefits, and use cases in a single pass over the content."""
+        for match in _SECTION_RE.finditer(content):
+            kind = next(kind for kind in _SECTION_KINDS if match.group(kind) is not None)
+            items = _BULLET_RE.findall(match.group('body'))
+            getattr(product_info, kind).extend([item.strip() for item in items if item.strip()])
     
     def _extract_target_market(self, content: str, product_info: ProductInfo):
         """Extract target market information."""
-        # Look for common target market keywords
-        target_keywords = [
-            'enterprise', 'small business', 'startup', 'b2b', 'b2c',
-            'developers', 'marketers', 'sales teams', 'managers',
-            'professionals', 'individuals', 'organizations'
-        ]
-        
-        content_lower = content.lower()
-        for keyword in target_keywords:
-            if keyword in content_lower:
-                product_info.target_market.append(keyword.title())
+        found = {match.group(1) for match in _TARGET_MARKET_RE.finditer(content.lower())}
+        product_info.target_market.extend(
+            keyword.title() for keyword in _TARGET_MARKET_KEYWORDS if keyword in found
+        )
     
     def _extract_pricing(self, content: str, product_info: ProductInfo):
         """Extract pricing information."""
-        # Look for pricing patterns
-        pricing_patterns = [
-            r'\$\d+(?:,\d{3})*(?:\.\d{2})?(?:/month|/mo|/year|/yr)?',
-            r'(?:free|freemium|subscription|license)',
-            r'(?:pricing|price|cost):?\s*(.+)',
-        ]
-        
-        for pattern in pricing_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for pattern in _PRICING_PATTERNS:
+            matches = pattern.findall(content)
             if matches:
                 product_info.pricing_info = ', '.join(str(m) for m in matches[:5])
                 break
     
     def _extract_technical_specs(self, content: str, product_info: ProductInfo):
         """Extract technical specifications."""
-        # Look for common tech spec patterns
-        spec_patterns = {
-            'platform': r'(?:platform|os|operating system):?\s*([^\n]+)',
-            'languages': r'(?:languages?|programming languages?):?\s*([^\n]+)',
-            'integration': r'(?:integrates? with|supports?):?\s*([^\n]+)',
-            'api': r'(?:api|rest api|graphql):?\s*([^\n]+)',
-        }
-        
-        for key, pattern in spec_patterns.items():
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for key, pattern in _SPEC_PATTERNS.items():
+            matches = pattern.findall(content)
             if matches:
                 product_info.technical_specs[key] = matches[0].strip()
     
@@ -323,23 +362,14 @@ class ProductAnalyzerTool(BaseTool):
         if product_info.product_name:
             sections.append(f"=== PRODUCT: {product_info.product_name} ===\n")
         
-        if product_info.features:
-            sections.append("FEATURES:")
-            for i, feature in enumerate(product_info.features, 1):
-                sections.append(f"  {i}. {feature}")
-            sections.append("")
-        
-        if product_info.benefits:
-            sections.append("BENEFITS:")
-            for i, benefit in enumerate(product_info.benefits, 1):
-                sections.append(f"  {i}. {benefit}")
-            sections.append("")
-        
-        if product_info.use_cases:
-            sections.append("USE CASES:")
-            for i, use_case in enumerate(product_info.use_cases, 1):
-                sections.append(f"  {i}. {use_case}")
-            sections.append("")
+        for heading, items in (
+            ("FEATURES", product_info.features),
+            ("BENEFITS", product_info.benefits),
+            ("USE CASES", product_info.use_cases),
+        ):
+            if items:
+                numbered = "\n".join(f"  {i}. {item}" for i, item in enumerate(items, 1))
+                sections.append(f"{heading}:\n{numbered}\n")
         
         if product_info.target_market:
             sections.append(f"TARGET MARKET: {', '.join(product_info.target_market)}\n")
@@ -348,14 +378,28 @@ class ProductAnalyzerTool(BaseTool):
             sections.append(f"PRICING: {product_info.pricing_info}\n")
         
         if product_info.technical_specs:
-            sections.append("TECHNICAL SPECS:")
-            for key, value in product_info.technical_specs.items():
-                sections.append(f"  - {key.title()}: {value}")
-            sections.append("")
+            specs = "\n".join(f"  - {key.title()}: {value}" for key, value in product_info.technical_specs.items())
+            sections.append(f"TECHNICAL SPECS:\n{specs}\n")
         
         return "\n".join(sections)
 
 
+# Simple keyword extraction for CompetitorAnalyzerTool - would use NLP in production
+_COMMON_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'})
+_KEYWORD_RE = re.compile(r'\b[a-z]{4,}\b')
+
+
+@functools.lru_cache(maxsize=512)
+def _extract_keywords(text: str) -> Tuple[str, ...]:
+    """Return the 10 most frequent non-stopword terms (cached per description)."""
+    words = _KEYWORD_RE.findall(text.lower())
+    keywords = [w for w in words if w not in _COMMON_WORDS]
+    
+    # Return top 10 most frequent
+    word_counts = Counter(keywords)
+    return tuple(word for word, count in word_counts.most_common(10))
+
+
 class CompetitorAnalyzerTool(BaseTool):
     """Tool for identifying and analyzing competitors from product information."""
     
@@ -398,13 +442,4 @@ class CompetitorAnalyzerTool(BaseTool):
     
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract key terms from product description."""
-        # Simple keyword extraction - would use NLP in production
-        common_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        
-        words = re.findall(r'\b[a-z]{4,}\b', text.lower())
-        keywords = [w for w in words if w not in common_words]
-        
-        # Return top 10 most frequent
-        from collections import Counter
-        word_counts = Counter(keywords)
-        return [word for word, count in word_counts.most_common(10)]
+        return list(_extract_keywords(text))
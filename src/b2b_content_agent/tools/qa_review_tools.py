@@ -10,6 +10,7 @@ These tools help the Quality Assurance Reviewer agent check content for:
 from crewai.tools import BaseTool
 from typing import Type, Dict, Any, List
 from pydantic import BaseModel, Field
+import functools
 import random
 import re
 
@@ -18,6 +19,49 @@ import re
 # TOOL 1: Accuracy Checker
 # =====================================================
 
+# Trigger phrase -> accuracy issue type (matched as lowercase substrings)
+_ACCURACY_TRIGGERS = {
+    '10x': 'exaggeration',
+    '1000%': 'exaggeration',
+    'revolutionary': 'exaggeration',
+    'game-changing': 'exaggeration',
+    'overnight': 'unrealistic_timeframe',
+    'instantly': 'unrealistic_timeframe',
+    'immediate results': 'unrealistic_timeframe',
+    'always': 'absolute_claim',
+    'never': 'absolute_claim',
+    'guaranteed': 'absolute_claim',
+    '100% success': 'absolute_claim',
+}
+
+# One alternation over every trigger; the lookahead lets overlapping phrases all match
+_ACCURACY_TRIGGER_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(phrase) for phrase in sorted(_ACCURACY_TRIGGERS, key=len, reverse=True)) + '))'
+)
+
+# Reported issues, in report order
+_ACCURACY_ISSUES = (
+    {
+        'type': 'exaggeration',
+        'severity': 'moderate',
+        'description': 'Content contains potentially exaggerated claims or superlatives',
+        'location': 'Multiple instances throughout'
+    },
+    {
+        'type': 'unrealistic_timeframe',
+        'severity': 'critical',
+        'description': 'Claims suggest unrealistic implementation or results timeframe',
+        'location': 'Results section'
+    },
+    {
+        'type': 'absolute_claim',
+        'severity': 'moderate',
+        'description': 'Content contains absolute claims that may not be universally true',
+        'location': 'Value propositions'
+    },
+)
+
+
 class AccuracyInput(BaseModel):
     """Input schema for Accuracy Checker."""
     content: str = Field(..., description="The content to check for accuracy")
@@ -50,10 +94,16 @@ class AccuracyChecker(BaseTool):
     
     def _run(self, content: str, content_type: str, claims_to_verify: str) -> str:
         """Check content for accuracy issues."""
+        return self._review(content, content_type, claims_to_verify)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _review(cls, content: str, content_type: str, claims_to_verify: str) -> str:
+        """Build the accuracy report; deterministic, so identical reviews are cached."""
         
-        issues = self._identify_accuracy_issues(content, claims_to_verify)
-        severity = self._assess_severity(issues)
-        recommendations = self._generate_recommendations(issues)
+        issues = cls._identify_accuracy_issues(content, claims_to_verify)
+        severity = cls._assess_severity(issues)
+        recommendations = cls._generate_recommendations(issues)
         
         output = f"""## ACCURACY REVIEW REPORT
 
@@ -65,7 +115,7 @@ class AccuracyChecker(BaseTool):
 
 ### IDENTIFIED ISSUES
 
-{self._format_issues(issues)}
+{cls._format_issues(issues)}
 
 ---
 
@@ -85,53 +135,33 @@ class AccuracyChecker(BaseTool):
 
 ### CORRECTED CLAIMS
 
-{self._suggest_corrections(claims_to_verify, issues)}
+{cls._suggest_corrections(claims_to_verify, issues)}
 
 **Review Status:** {'⚠️ NEEDS REVISION' if len(issues) > 2 else '✅ APPROVED'}
 """
         return output
     
-    def _identify_accuracy_issues(self, content: str, claims: str) -> List[Dict[str, Any]]:
-        """Identify potential accuracy issues."""
-        issues = []
-        
-        # Check for exaggerated metrics
-        if any(word in content.lower() for word in ['10x', '1000%', 'revolutionary', 'game-changing']):
-            issues.append({
-                'type': 'exaggeration',
-                'severity': 'moderate',
-                'description': 'Content contains potentially exaggerated claims or superlatives',
-                'location': 'Multiple instances throughout'
-            })
-        
-        # Check for unrealistic timeframes
-        if any(phrase in content.lower() for phrase in ['overnight', 'instantly', 'immediate results']):
-            issues.append({
-                'type': 'unrealistic_timeframe',
-                'severity': 'critical',
-                'description': 'Claims suggest unrealistic implementation or results timeframe',
-                'location': 'Results section'
-            })
-        
-        # Check for unsupported absolute claims
-        if any(word in content.lower() for word in ['always', 'never', 'guaranteed', '100% success']):
-            issues.append({
-                'type': 'absolute_claim',
-                'severity': 'moderate',
-                'description': 'Content contains absolute claims that may not be universally true',
-                'location': 'Value propositions'
-            })
+    @staticmethod
+    def _identify_accuracy_issues(content: str, claims: str) -> List[Dict[str, Any]]:
+        """Identify potential accuracy issues in a single scan of the content."""
+        found = set()
+        for match in _ACCURACY_TRIGGER_RE.finditer(content.lower()):
+            found.add(_ACCURACY_TRIGGERS[match.group(1)])
+            if len(found) == len(_ACCURACY_ISSUES):
+                break
         
-        return issues
+        return [dict(issue) for issue in _ACCURACY_ISSUES if issue['type'] in found]
     
-    def _assess_severity(self, issues: List[Dict]) -> Dict[str, int]:
+    @staticmethod
+    def _assess_severity(issues: List[Dict]) -> Dict[str, int]:
         """Assess severity distribution."""
         severity_counts = {'critical': 0, 'moderate': 0, 'minor': 0}
         for issue in issues:
             severity_counts[issue.get('severity', 'minor')] += 1
         return severity_counts
     
-    def _generate_recommendations(self, issues: List[Dict]) -> List[str]:
+    @staticmethod
+    def _generate_recommendations(issues: List[Dict]) -> List[str]:
         """Generate fix recommendations."""
         recommendations = []
         
@@ -148,7 +178,8 @@ class AccuracyChecker(BaseTool):
         
         return recommendations
     
-    def _format_issues(self, issues: List[Dict]) -> str:
+    @staticmethod
+    def _format_issues(issues: List[Dict]) -> str:
         """Format issues for output."""
         if not issues:
             return "✅ No accuracy issues identified."
@@ -163,7 +194,8 @@ class AccuracyChecker(BaseTool):
 """)
         return '\n'.join(formatted)
     
-    def _suggest_corrections(self, claims: str, issues: List[Dict]) -> str:
+    @staticmethod
+    def _suggest_corrections(claims: str, issues: List[Dict]) -> str:
         """Suggest corrected versions of claims."""
         if not issues:
             return "✅ All claims are accurate and well-supported."
@@ -184,6 +216,13 @@ class AccuracyChecker(BaseTool):
 # TOOL 2: Consistency Validator
 # =====================================================
 
+# Passive voice indicators; none can overlap another, so one sweep counts them all
+_PASSIVE_VOICE_RE = re.compile(r'is being|was being|has been|have been|will be')
+
+# Sentence boundaries for the long-sentence check
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+
 class ConsistencyInput(BaseModel):
     """Input schema for Consistency Validator."""
     content: str = Field(..., description="The content to check for consistency")
@@ -217,10 +256,16 @@ class ConsistencyValidator(BaseTool):
     
     def _run(self, content: str, brand_guidelines: str, content_type: str) -> str:
         """Check content for consistency issues."""
+        return self._review(content, brand_guidelines, content_type)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _review(cls, content: str, brand_guidelines: str, content_type: str) -> str:
+        """Build the consistency report; deterministic, so identical reviews are cached."""
         
-        naming_issues = self._check_naming_consistency(content)
-        formatting_issues = self._check_formatting(content)
-        style_issues = self._check_style_compliance(content)
+        naming_issues = cls._check_naming_consistency(content)
+        formatting_issues = cls._check_formatting(content)
+        style_issues = cls._check_style_compliance(content)
         
         total_issues = len(naming_issues) + len(formatting_issues) + len(style_issues)
         
@@ -234,19 +279,19 @@ class ConsistencyValidator(BaseTool):
 
 ### NAMING CONSISTENCY
 
-{self._format_naming_issues(naming_issues)}
+{cls._format_naming_issues(naming_issues)}
 
 ---
 
 ### FORMATTING CONSISTENCY
 
-{self._format_formatting_issues(formatting_issues)}
+{cls._format_formatting_issues(formatting_issues)}
 
 ---
 
 ### STYLE COMPLIANCE
 
-{self._format_style_issues(style_issues)}
+{cls._format_style_issues(style_issues)}
 
 ---
 
@@ -266,7 +311,8 @@ class ConsistencyValidator(BaseTool):
 """
         return output
     
-    def _check_naming_consistency(self, content: str) -> List[str]:
+    @staticmethod
+    def _check_naming_consistency(content: str) -> List[str]:
         """Check for naming inconsistencies."""
         issues = []
         
@@ -275,12 +321,14 @@ class ConsistencyValidator(BaseTool):
             issues.append("Product name capitalization inconsistent (found 'friend', 'FRIEND', should be 'Friend AI')")
         
         # Check for inconsistent terminology
-        if 'platform' in content.lower() and 'solution' in content.lower() and 'product' in content.lower():
+        content_lower = content.lower()
+        if 'platform' in content_lower and 'solution' in content_lower and 'product' in content_lower:
             issues.append("Mixed terminology: using 'platform', 'solution', and 'product' interchangeably")
         
         return issues
     
-    def _check_formatting(self, content: str) -> List[str]:
+    @staticmethod
+    def _check_formatting(content: str) -> List[str]:
         """Check formatting consistency."""
         issues = []
         
@@ -302,35 +350,38 @@ class ConsistencyValidator(BaseTool):
         
         return issues
     
-    def _check_style_compliance(self, content: str) -> List[str]:
+    @staticmethod
+    def _check_style_compliance(content: str) -> List[str]:
         """Check style guide compliance."""
         issues = []
         
         # Check for passive voice (simplified check)
-        passive_indicators = ['is being', 'was being', 'has been', 'have been', 'will be']
-        passive_count = sum(content.lower().count(phrase) for phrase in passive_indicators)
+        passive_count = len(_PASSIVE_VOICE_RE.findall(content.lower()))
         if passive_count > 5:
             issues.append(f"Excessive passive voice ({passive_count} instances) - prefer active voice")
         
         # Check sentence length (simplified)
-        sentences = re.split(r'[.!?]+', content)
+        sentences = _SENTENCE_SPLIT_RE.split(content)
         long_sentences = [s for s in sentences if len(s.split()) > 30]
         if len(long_sentences) > 5:
             issues.append(f"Several long sentences ({len(long_sentences)} over 30 words) - consider breaking up for readability")
         
         return issues
     
-    def _format_naming_issues(self, issues: List[str]) -> str:
+    @staticmethod
+    def _format_naming_issues(issues: List[str]) -> str:
         if not issues:
             return "✅ Product names and terminology are consistent."
         return '\n'.join(f'- {issue}' for issue in issues)
     
-    def _format_formatting_issues(self, issues: List[str]) -> str:
+    @staticmethod
+    def _format_formatting_issues(issues: List[str]) -> str:
         if not issues:
             return "✅ Formatting is consistent throughout."
         return '\n'.join(f'- {issue}' for issue in issues)
     
-    def _format_style_issues(self, issues: List[str]) -> str:
+    @staticmethod
+    def _format_style_issues(issues: List[str]) -> str:
         if not issues:
             return "✅ Content complies with style guidelines."
         return '\n'.join(f'- {issue}' for issue in issues)
@@ -340,6 +391,32 @@ class ConsistencyValidator(BaseTool):
 # TOOL 3: Readability Analyzer
 # =====================================================
 
+# Business jargon indicators, counted as substrings of the lowercased content
+_JARGON_INDICATORS = ('leverage', 'synergy', 'paradigm', 'utilize', 'optimize', 'strategize')
+
+
+@functools.lru_cache(maxsize=8192)
+def _count_syllables(word: str) -> int:
+    """Simplified syllable counter (cached; business prose repeats a small vocabulary)."""
+    word = word.lower()
+    vowels = 'aeiouy'
+    count = 0
+    previous_was_vowel = False
+    
+    for char in word:
+        is_vowel = char in vowels
+        if is_vowel and not previous_was_vowel:
+            count += 1
+        previous_was_vowel = is_vowel
+    
+    if word.endswith('e'):
+        count -= 1
+    if count == 0:
+        count = 1
+        
+    return count
+
+
 class ReadabilityInput(BaseModel):
     """Input schema for Readability Analyzer."""
     content: str = Field(..., description="The content to analyze for readability")
@@ -373,10 +450,17 @@ class ReadabilityAnalyzer(BaseTool):
     
     def _run(self, content: str, target_audience: str, content_type: str) -> str:
         """Analyze content readability."""
+        return self._review(content, target_audience, content_type)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _review(cls, content: str, target_audience: str, content_type: str) -> str:
+        """Build the readability report; deterministic, so identical analyses are cached."""
         
-        scores = self._calculate_readability_scores(content)
-        complexity = self._analyze_complexity(content)
-        recommendations = self._generate_readability_recommendations(scores, complexity, target_audience)
+        stats = cls._scan_text(content)
+        scores = cls._calculate_readability_scores(stats)
+        complexity = cls._analyze_complexity(content, stats)
+        recommendations = cls._generate_readability_recommendations(scores, complexity, target_audience)
         
         output = f"""## READABILITY ANALYSIS REPORT
 
@@ -424,20 +508,39 @@ class ReadabilityAnalyzer(BaseTool):
 """
         return output
     
-    def _calculate_readability_scores(self, content: str) -> Dict[str, Any]:
+    @staticmethod
+    def _scan_text(content: str) -> Dict[str, int]:
+        """Tokenize the content once and collect the counts used by scores and complexity."""
+        sentence_splits = _SENTENCE_SPLIT_RE.split(content)
+        words = content.split()
+        word_syllables = [_count_syllables(word) for word in words]
+        
+        return {
+            'sentence_splits': len(sentence_splits),
+            'sentences': sum(1 for s in sentence_splits if s.strip()),
+            'words': len(words),
+            'characters': sum(len(w) for w in words),
+            'syllables': sum(word_syllables),
+            'complex_words': sum(1 for count in word_syllables if count >= 3),
+        }
+    
+    @staticmethod
+    def _calculate_readability_scores(stats: Dict[str, int]) -> Dict[str, Any]:
         """Calculate Flesch reading scores (simplified implementation)."""
         
         # Simplified calculations for demonstration
-        sentences = len(re.split(r'[.!?]+', content))
-        words = len(content.split())
-        syllables = sum(self._count_syllables(word) for word in content.split())
+        sentences = stats['sentence_splits']
+        words = stats['words']
+        syllables = stats['syllables']
+        words_per_sentence = words / max(sentences, 1)
+        syllables_per_word = syllables / max(words, 1)
         
         # Flesch Reading Ease: 206.835 - 1.015(words/sentences) - 84.6(syllables/words)
-        flesch_ease = max(0, min(100, 206.835 - 1.015 * (words / max(sentences, 1)) - 84.6 * (syllables / max(words, 1))))
+        flesch_ease = max(0, min(100, 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word))
         flesch_ease = round(flesch_ease, 1)
         
         # Flesch-Kincaid Grade Level: 0.39(words/sentences) + 11.8(syllables/words) - 15.59
-        grade_level = max(0, 0.39 * (words / max(sentences, 1)) + 11.8 * (syllables / max(words, 1)) - 15.59)
+        grade_level = max(0, 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59)
         grade_level = round(grade_level, 1)
         
         # Interpretations
@@ -474,47 +577,28 @@ class ReadabilityAnalyzer(BaseTool):
             'action_needed': action_needed
         }
     
-    def _count_syllables(self, word: str) -> int:
-        """Simplified syllable counter."""
-        word = word.lower()
-        vowels = 'aeiouy'
-        count = 0
-        previous_was_vowel = False
-        
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not previous_was_vowel:
-                count += 1
-            previous_was_vowel = is_vowel
-        
-        if word.endswith('e'):
-            count -= 1
-        if count == 0:
-            count = 1
-            
-        return count
-    
-    def _analyze_complexity(self, content: str) -> Dict[str, Any]:
+    @staticmethod
+    def _analyze_complexity(content: str, stats: Dict[str, int]) -> Dict[str, Any]:
         """Analyze sentence and word complexity."""
         
-        sentences = [s.strip() for s in re.split(r'[.!?]+', content) if s.strip()]
-        words = content.split()
-        paragraphs = [p.strip() for p in content.split('\n\n') if p.strip()]
-        
-        avg_sentence_length = round(len(words) / max(len(sentences), 1), 1)
-        avg_word_length = round(sum(len(w) for w in words) / max(len(words), 1), 1)
+        word_count = max(stats['words'], 1)
+        avg_sentence_length = round(stats['words'] / max(stats['sentences'], 1), 1)
+        avg_word_length = round(stats['characters'] / word_count, 1)
         
-        # Count complex words (3+ syllables)
-        complex_words = [w for w in words if self._count_syllables(w) >= 3]
-        complex_percentage = round((len(complex_words) / max(len(words), 1)) * 100, 1)
+        # Complex words have 3+ syllables
+        complex_percentage = round((stats['complex_words'] / word_count) * 100, 1)
         
         # Estimate jargon density
-        jargon_indicators = ['leverage', 'synergy', 'paradigm', 'utilize', 'optimize', 'strategize']
-        jargon_count = sum(content.lower().count(word) for word in jargon_indicators)
+        lowered = content.lower()
+        jargon_count = sum(lowered.count(word) for word in _JARGON_INDICATORS)
         jargon_density = "Low" if jargon_count < 5 else "Medium" if jargon_count < 10 else "High"
         
         # Paragraph analysis
-        paragraph_lengths = [len(re.split(r'[.!?]+', p)) for p in paragraphs]
+        # (a paragraph of n sentence terminators splits into n + 1 pieces)
+        paragraph_lengths = [
+            len(_SENTENCE_SPLIT_RE.findall(p)) + 1
+            for p in content.split('\n\n') if p and not p.isspace()
+        ]
         avg_paragraph_length = round(sum(paragraph_lengths) / max(len(paragraph_lengths), 1), 1)
         longest_paragraph = max(paragraph_lengths) if paragraph_lengths else 0
         
@@ -527,7 +611,8 @@ class ReadabilityAnalyzer(BaseTool):
             'longest_paragraph': longest_paragraph
         }
     
-    def _generate_readability_recommendations(self, scores: Dict, complexity: Dict, target_audience: str) -> List[str]:
+    @staticmethod
+    def _generate_readability_recommendations(scores: Dict, complexity: Dict, target_audience: str) -> List[str]:
         """Generate improvement recommendations."""
         recommendations = []
         
@@ -557,6 +642,28 @@ class ReadabilityAnalyzer(BaseTool):
 # TOOL 4: Link Validator
 # =====================================================
 
+# Common CTA patterns, compiled once at import (only the whole match is used,
+# so the alternations don't capture)
+_CTA_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), cta_type)
+    for pattern, cta_type in [
+        (r'schedule (?:a|an|your) (?:demo|call|meeting)', 'Schedule Demo'),
+        (r'contact (?:us|sales|our team)', 'Contact Sales'),
+        (r'learn more', 'Learn More'),
+        (r'get started', 'Get Started'),
+        (r'download (?:the|our)', 'Download Resource'),
+        (r'sign up', 'Sign Up'),
+        (r'request (?:a|an) (?:demo|quote|consultation)', 'Request Demo'),
+        (r'visit (?:our website|us at)', 'Visit Website'),
+    ]
+]
+
+# Reference patterns
+_URL_RE = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_CITATION_RE = re.compile(r'\[\d+\]|\(\d+\)')
+
+
 class LinkInput(BaseModel):
     """Input schema for Link Validator."""
     content: str = Field(..., description="The content to check for CTAs and references")
@@ -587,11 +694,17 @@ class LinkValidator(BaseTool):
     
     def _run(self, content: str, content_type: str) -> str:
         """Validate CTAs and links in content."""
+        return self._review(content, content_type)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _review(cls, content: str, content_type: str) -> str:
+        """Build the CTA and link report; deterministic, so identical validations are cached."""
         
-        ctas = self._identify_ctas(content)
-        references = self._identify_references(content)
-        effectiveness = self._assess_cta_effectiveness(ctas)
-        recommendations = self._generate_cta_recommendations(ctas, effectiveness, content_type)
+        ctas = cls._identify_ctas(content)
+        references = cls._identify_references(content)
+        effectiveness = cls._assess_cta_effectiveness(ctas)
+        recommendations = cls._generate_cta_recommendations(ctas, effectiveness, content_type)
         
         output = f"""## LINK & CTA VALIDATION REPORT
 
@@ -603,7 +716,7 @@ class LinkValidator(BaseTool):
 
 ### IDENTIFIED CALLS-TO-ACTION
 
-{self._format_ctas(ctas)}
+{cls._format_ctas(ctas)}
 
 ---
 
@@ -619,7 +732,7 @@ class LinkValidator(BaseTool):
 
 ### REFERENCES & LINKS
 
-{self._format_references(references)}
+{cls._format_references(references)}
 
 ---
 
@@ -637,31 +750,23 @@ class LinkValidator(BaseTool):
 """
         return output
     
-    def _identify_ctas(self, content: str) -> List[Dict[str, str]]:
+    @staticmethod
+    def _identify_ctas(content: str) -> List[Dict[str, str]]:
         """Identify all CTAs in content."""
         ctas = []
-        
-        # Common CTA patterns
-        cta_patterns = [
-            (r'schedule (a|an|your) (demo|call|meeting)', 'Schedule Demo'),
-            (r'contact (us|sales|our team)', 'Contact Sales'),
-            (r'learn more', 'Learn More'),
-            (r'get started', 'Get Started'),
-            (r'download (the|our)', 'Download Resource'),
-            (r'sign up', 'Sign Up'),
-            (r'request (a|an) (demo|quote|consultation)', 'Request Demo'),
-            (r'visit (our website|us at)', 'Visit Website'),
-        ]
-        
-        for pattern, cta_type in cta_patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
-                context = content[max(0, match.start()-50):min(len(content), match.end()+50)]
+        content_length = len(content)
+        beginning_end = content_length * 0.3
+        middle_end = content_length * 0.7
+        
+        for pattern, cta_type in _CTA_PATTERNS:
+            for match in pattern.finditer(content):
+                start = match.start()
+                context = content[max(0, start-50):min(content_length, match.end()+50)]
                 ctas.append({
                     'type': cta_type,
                     'text': match.group(),
                     'context': context.strip(),
-                    'position': 'beginning' if match.start() < len(content) * 0.3 else 'middle' if match.start() < len(content) * 0.7 else 'end'
+                    'position': 'beginning' if start < beginning_end else 'middle' if start < middle_end else 'end'
                 })
         
         if not ctas:
@@ -674,22 +779,23 @@ class LinkValidator(BaseTool):
         
         return ctas
     
-    def _identify_references(self, content: str) -> List[str]:
+    @staticmethod
+    def _identify_references(content: str) -> List[str]:
         """Identify references and citations."""
         references = []
         
         # Look for URLs
-        urls = re.findall(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', content)
+        urls = _URL_RE.findall(content)
         if urls:
             references.append(f"URLs found: {len(urls)}")
         
         # Look for email addresses
-        emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', content)
+        emails = _EMAIL_RE.findall(content)
         if emails:
             references.append(f"Email addresses found: {len(emails)}")
         
         # Look for reference markers
-        if re.search(r'\[\d+\]|\(\d+\)', content):
+        if _CITATION_RE.search(content):
             references.append("Citation markers found (proper academic style)")
         
         if not references:
@@ -697,7 +803,8 @@ class LinkValidator(BaseTool):
         
         return references
     
-    def _assess_cta_effectiveness(self, ctas: List[Dict]) -> Dict[str, Any]:
+    @staticmethod
+    def _assess_cta_effectiveness(ctas: List[Dict]) -> Dict[str, Any]:
         """Assess CTA effectiveness."""
         
         if ctas[0]['type'] == 'Missing':
@@ -736,7 +843,8 @@ class LinkValidator(BaseTool):
             'reference_status': '✅ VALID'
         }
     
-    def _format_ctas(self, ctas: List[Dict]) -> str:
+    @staticmethod
+    def _format_ctas(ctas: List[Dict]) -> str:
         """Format CTAs for output."""
         if ctas[0]['type'] == 'Missing':
             return "❌ No CTAs identified in content - add clear calls-to-action"
@@ -751,11 +859,13 @@ class LinkValidator(BaseTool):
 """)
         return '\n'.join(formatted)
     
-    def _format_references(self, references: List[str]) -> str:
+    @staticmethod
+    def _format_references(references: List[str]) -> str:
         """Format references for output."""
         return '\n'.join(f'- {ref}' for ref in references)
     
-    def _generate_cta_recommendations(self, ctas: List[Dict], effectiveness: Dict, content_type: str) -> List[str]:
+    @staticmethod
+    def _generate_cta_recommendations(ctas: List[Dict], effectiveness: Dict, content_type: str) -> List[str]:
         """Generate CTA improvement recommendations."""
         recommendations = []
         
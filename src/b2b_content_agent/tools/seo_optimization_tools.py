@@ -8,11 +8,22 @@ These tools help the SEO Optimizer agent improve content discoverability:
 """
 
 from crewai.tools import BaseTool
-from typing import Type, Dict, Any, List
+from typing import Type, Dict, Any, List, Mapping, Tuple
 from pydantic import BaseModel, Field
+from types import MappingProxyType
+import functools
 import random
 
 
+def _freeze(value: Any) -> Any:
+    """Recursively make shared reference data read-only (dicts -> mapping proxies, lists/tuples -> tuples)."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 # =====================================================
 # TOOL 1: Keyword Optimizer
 # =====================================================
@@ -49,11 +60,21 @@ class KeywordOptimizer(BaseTool):
     
     def _run(self, content: str, target_keywords: str, content_type: str) -> str:
         """Analyze and optimize keyword usage."""
+        return self._review(content, target_keywords, content_type)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _review(cls, content: str, target_keywords: str, content_type: str) -> str:
+        """Build the keyword report; deterministic, so identical analyses are cached."""
         
-        keywords = self._extract_keywords(target_keywords)
-        keyword_analysis = self._analyze_keyword_usage(content, keywords)
-        placement_analysis = self._analyze_keyword_placement(content, keywords)
-        density_check = self._check_keyword_density(content, keywords)
+        keywords = cls._extract_keywords(target_keywords)
+        content_lower = content.lower()
+        keyword_counts = cls._count_keywords(content_lower, keywords)
+        keyword_analysis = cls._analyze_keyword_usage(keywords, keyword_counts)
+        placement_analysis = cls._analyze_keyword_placement(content, content_lower, keywords)
+        density_check = cls._check_keyword_density(content, keywords, keyword_counts)
+        recommendations = cls._generate_keyword_recommendations(keyword_analysis, placement_analysis, density_check)
+        recommendation_lines = "\n".join(f'{i+1}. {rec}' for i, rec in enumerate(recommendations))
         
         output = f"""## KEYWORD OPTIMIZATION REPORT
 
@@ -65,31 +86,31 @@ class KeywordOptimizer(BaseTool):
 
 ### KEYWORD USAGE ANALYSIS
 
-{self._format_keyword_usage(keyword_analysis)}
+{cls._format_keyword_usage(keyword_analysis)}
 
 ---
 
 ### PLACEMENT ANALYSIS
 
-{self._format_placement_analysis(placement_analysis)}
+{cls._format_placement_analysis(placement_analysis)}
 
 ---
 
 ### DENSITY CHECK
 
-{self._format_density_check(density_check)}
+{cls._format_density_check(density_check)}
 
 ---
 
 ### KEYWORD VARIATIONS SUGGESTED
 
-{self._format_keyword_variations(keywords)}
+{cls._format_keyword_variations(keywords)}
 
 ---
 
 ### RECOMMENDATIONS
 
-{chr(10).join(f'{i+1}. {rec}' for i, rec in enumerate(self._generate_keyword_recommendations(keyword_analysis, placement_analysis, density_check)))}
+{recommendation_lines}
 
 ---
 
@@ -98,8 +119,10 @@ class KeywordOptimizer(BaseTool):
 """
         return output
     
-    def _extract_keywords(self, target_keywords: str) -> Dict[str, List[str]]:
-        """Extract primary and secondary keywords."""
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _extract_keywords(target_keywords: str) -> Mapping[str, Tuple[str, ...]]:
+        """Extract primary and secondary keywords (cached and read-only; the same keyword string recurs across calls)."""
         
         primary = []
         secondary = []
@@ -117,47 +140,49 @@ class KeywordOptimizer(BaseTool):
                 is_primary_section = True
                 is_secondary_section = False
                 # Extract keyword from same line
-                keyword = part.split('primary')[-1].strip().strip(':').strip()
-                if keyword and len(keyword) > 3:
+                keyword = part.rpartition('primary')[2].strip().strip(':').strip()
+                if len(keyword) > 3:
                     primary.append(keyword)
             elif 'secondary' in part:
                 is_secondary_section = True
                 is_primary_section = False
                 # Extract keyword from same line
-                keyword = part.split('secondary')[-1].strip().strip(':').strip()
-                if keyword and len(keyword) > 3:
+                keyword = part.rpartition('secondary')[2].strip().strip(':').strip()
+                if len(keyword) > 3:
                     secondary.append(keyword)
-            elif is_primary_section and part and len(part) > 3:
-                primary.append(part.strip())
-            elif is_secondary_section and part and len(part) > 3:
-                secondary.append(part.strip())
-            elif not is_primary_section and not is_secondary_section and part and len(part) > 5:
-                # Default to primary if no section specified
-                primary.append(part.strip())
+            elif len(part) > 3:
+                if is_primary_section:
+                    primary.append(part)
+                elif is_secondary_section:
+                    secondary.append(part)
+                elif len(part) > 5:
+                    # Default to primary if no section specified
+                    primary.append(part)
         
         # Ensure we have at least one primary keyword
         if not primary:
             primary = ['productivity', 'efficiency']
         
+        return MappingProxyType({
+            'primary': tuple(primary[:3]),  # Max 3 primary
+            'secondary': tuple(secondary[:5])  # Max 5 secondary
+        })
+    
+    @staticmethod
+    def _count_keywords(content_lower: str, keywords: Mapping[str, Tuple[str, ...]]) -> Dict[str, int]:
+        """Count every target keyword once; usage and density both read these counts."""
+        
         return {
-            'primary': primary[:3],  # Max 3 primary
-            'secondary': secondary[:5]  # Max 5 secondary
+            keyword: content_lower.count(keyword)
+            for keyword in keywords['primary'] + keywords['secondary']
         }
     
-    def _analyze_keyword_usage(self, content: str, keywords: Dict[str, List[str]]) -> Dict[str, Any]:
+    @staticmethod
+    def _analyze_keyword_usage(keywords: Mapping[str, Tuple[str, ...]], counts: Dict[str, int]) -> Dict[str, Any]:
         """Analyze how keywords are used in content."""
         
-        content_lower = content.lower()
-        
-        primary_usage = {}
-        for keyword in keywords['primary']:
-            count = content_lower.count(keyword)
-            primary_usage[keyword] = count
-        
-        secondary_usage = {}
-        for keyword in keywords['secondary']:
-            count = content_lower.count(keyword)
-            secondary_usage[keyword] = count
+        primary_usage = {keyword: counts[keyword] for keyword in keywords['primary']}
+        secondary_usage = {keyword: counts[keyword] for keyword in keywords['secondary']}
         
         # Calculate overall score
         primary_score = sum(1 for count in primary_usage.values() if count >= 2) / max(len(keywords['primary']), 1) * 100
@@ -179,21 +204,21 @@ class KeywordOptimizer(BaseTool):
             'status': status
         }
     
-    def _analyze_keyword_placement(self, content: str, keywords: Dict[str, List[str]]) -> Dict[str, Any]:
+    @staticmethod
+    def _analyze_keyword_placement(content: str, content_lower: str, keywords: Mapping[str, Tuple[str, ...]]) -> Dict[str, Any]:
         """Analyze keyword placement in key positions."""
         
-        content_lower = content.lower()
-        
         # Check first 200 characters (intro)
         intro = content_lower[:200]
         intro_keywords = sum(1 for kw in keywords['primary'] if kw in intro)
         
-        # Check headings (lines starting with # or all caps)
+        # Check headings (lines starting with # or all caps); keywords are already lowercase
         lines = content.split('\n')
         heading_keywords = 0
         for line in lines:
-            if line.strip().startswith('#') or (line.isupper() and len(line) > 5):
-                heading_keywords += sum(1 for kw in keywords['primary'] if kw.lower() in line.lower())
+            if line.lstrip().startswith('#') or (line.isupper() and len(line) > 5):
+                line_lower = line.lower()
+                heading_keywords += sum(1 for kw in keywords['primary'] if kw in line_lower)
         
         # Check conclusion (last 200 characters)
         conclusion = content_lower[-200:]
@@ -208,17 +233,17 @@ class KeywordOptimizer(BaseTool):
             'conclusion_count': conclusion_keywords
         }
     
-    def _check_keyword_density(self, content: str, keywords: Dict[str, List[str]]) -> Dict[str, Any]:
+    @staticmethod
+    def _check_keyword_density(content: str, keywords: Mapping[str, Tuple[str, ...]], counts: Dict[str, int]) -> Dict[str, Any]:
         """Check if keyword density is appropriate."""
         
         word_count = len(content.split())
-        content_lower = content.lower()
         
         densities = {}
         issues = []
         
         for keyword in keywords['primary']:
-            count = content_lower.count(keyword)
+            count = counts[keyword]
             density = (count / max(word_count, 1)) * 100
             densities[keyword] = {
                 'count': count,
@@ -239,51 +264,55 @@ class KeywordOptimizer(BaseTool):
             'health': overall_health
         }
     
-    def _format_keyword_usage(self, analysis: Dict) -> str:
+    @staticmethod
+    def _format_keyword_usage(analysis: Dict) -> str:
         """Format keyword usage results."""
-        output = "**Primary Keywords:**\n"
+        lines = ["**Primary Keywords:**\n"]
         for keyword, count in analysis['primary_usage'].items():
             status = "✅" if count >= 2 else "⚠️"
-            output += f"{status} '{keyword}': {count} occurrences\n"
+            lines.append(f"{status} '{keyword}': {count} occurrences\n")
         
-        output += "\n**Secondary Keywords:**\n"
+        lines.append("\n**Secondary Keywords:**\n")
         for keyword, count in analysis['secondary_usage'].items():
             status = "✅" if count >= 1 else "⚠️"
-            output += f"{status} '{keyword}': {count} occurrences\n"
+            lines.append(f"{status} '{keyword}': {count} occurrences\n")
         
-        return output
+        return ''.join(lines)
     
-    def _format_placement_analysis(self, placement: Dict) -> str:
+    @staticmethod
+    def _format_placement_analysis(placement: Dict) -> str:
         """Format placement analysis results."""
-        output = "**Key Position Coverage:**\n"
-        output += f"{'✅' if placement['in_intro'] else '❌'} Introduction: {placement['intro_count']} keywords\n"
-        output += f"{'✅' if placement['in_headings'] else '❌'} Headings: {placement['heading_count']} keywords\n"
-        output += f"{'✅' if placement['in_conclusion'] else '❌'} Conclusion: {placement['conclusion_count']} keywords\n"
-        
         if placement['in_intro'] and placement['in_headings'] and placement['in_conclusion']:
-            output += "\n✅ Excellent keyword distribution across all key positions"
+            verdict = "✅ Excellent keyword distribution across all key positions"
         else:
-            output += "\n⚠️ Improve keyword placement in missing key positions"
-        
-        return output
+            verdict = "⚠️ Improve keyword placement in missing key positions"
+        
+        return (
+            "**Key Position Coverage:**\n"
+            f"{'✅' if placement['in_intro'] else '❌'} Introduction: {placement['intro_count']} keywords\n"
+            f"{'✅' if placement['in_headings'] else '❌'} Headings: {placement['heading_count']} keywords\n"
+            f"{'✅' if placement['in_conclusion'] else '❌'} Conclusion: {placement['conclusion_count']} keywords\n"
+            f"\n{verdict}"
+        )
     
-    def _format_density_check(self, density: Dict) -> str:
+    @staticmethod
+    def _format_density_check(density: Dict) -> str:
         """Format density check results."""
-        output = f"**Total Word Count:** {density['word_count']} words\n\n"
-        output += "**Keyword Density:**\n"
+        lines = [f"**Total Word Count:** {density['word_count']} words\n\n", "**Keyword Density:**\n"]
         
         for keyword, data in density['densities'].items():
-            output += f"- '{keyword}': {data['count']} times ({data['density']}%)\n"
+            lines.append(f"- '{keyword}': {data['count']} times ({data['density']}%)\n")
         
         if density['issues']:
-            output += "\n**Issues:**\n"
-            output += '\n'.join(f"⚠️ {issue}" for issue in density['issues'])
+            lines.append("\n**Issues:**\n")
+            lines.append('\n'.join(f"⚠️ {issue}" for issue in density['issues']))
         else:
-            output += "\n✅ Keyword density is within optimal range (0.5-3%)"
+            lines.append("\n✅ Keyword density is within optimal range (0.5-3%)")
         
-        return output
+        return ''.join(lines)
     
-    def _format_keyword_variations(self, keywords: Dict) -> str:
+    @staticmethod
+    def _format_keyword_variations(keywords: Mapping) -> str:
         """Suggest keyword variations."""
         
         variations = []
@@ -304,7 +333,8 @@ class KeywordOptimizer(BaseTool):
         
         return '\n'.join(variations[:4])
     
-    def _generate_keyword_recommendations(self, usage: Dict, placement: Dict, density: Dict) -> List[str]:
+    @staticmethod
+    def _generate_keyword_recommendations(usage: Dict, placement: Dict, density: Dict) -> List[str]:
         """Generate keyword optimization recommendations."""
         recommendations = []
         
@@ -336,6 +366,67 @@ class KeywordOptimizer(BaseTool):
 # TOOL 2: Metadata Generator
 # =====================================================
 
+@functools.lru_cache(maxsize=32)
+def _content_type_title(content_type: str) -> str:
+    """Title-cased display name for a content type (e.g. 'case_study' -> 'Case Study')."""
+    return content_type.replace('_', ' ').title()
+
+
+# Meta title options per content type: keyword-first, value-first, question
+_META_TITLE_TEMPLATES = {
+    'case_study': (
+        "{keyword}: Customer Success Story",
+        "How TechCorp Achieved 40% Growth with {keyword}",
+        "Need Better {keyword}? See How",
+    ),
+    'white_paper': (
+        "{keyword}: Complete Guide 2025",
+        "The Ultimate {keyword} Strategy Guide",
+        "Need Better {keyword}? See How",
+    ),
+    'pitch_deck': (
+        "{keyword}: Product Overview",
+        "Proven {keyword} Best Practices",
+        "Need Better {keyword}? See How",
+    ),
+}
+_DEFAULT_META_TITLE_TEMPLATES = (
+    "{keyword}: {content_type}",
+    "Proven {keyword} Best Practices",
+    "Need Better {keyword}? See How",
+)
+
+# Meta description options per content type: results-focused, problem-solution, benefit-focused
+_PROBLEM_SOLUTION_DESCRIPTION = (
+    "Struggling with {keyword}? This {content_type} shows "
+    "how top performers solve common challenges and achieve 40%+ improvements."
+)
+_BENEFIT_DESCRIPTION = (
+    "Unlock the full potential of {keyword}. Expert insights, real examples, "
+    "and practical frameworks to accelerate your success."
+)
+_META_DESCRIPTION_TEMPLATES = {
+    'case_study': (
+        "Discover how leading companies use {keyword} to drive measurable results. "
+        "Real metrics, proven strategies, and actionable insights. Download now.",
+        _PROBLEM_SOLUTION_DESCRIPTION,
+        _BENEFIT_DESCRIPTION,
+    ),
+    'white_paper': (
+        "Complete guide to {keyword} for B2B teams. Best practices, frameworks, "
+        "and implementation strategies. Free download available.",
+        _PROBLEM_SOLUTION_DESCRIPTION,
+        _BENEFIT_DESCRIPTION,
+    ),
+}
+_DEFAULT_META_DESCRIPTION_TEMPLATES = (
+    "Learn how {keyword} helps B2B teams improve efficiency and drive growth. "
+    "Practical insights and proven strategies included.",
+    _PROBLEM_SOLUTION_DESCRIPTION,
+    _BENEFIT_DESCRIPTION,
+)
+
+
 class MetadataInput(BaseModel):
     """Input schema for Metadata Generator."""
     content: str = Field(..., description="Content to generate metadata for")
@@ -367,16 +458,27 @@ class MetadataGenerator(BaseTool):
     
     def _run(self, content: str, target_keywords: str, content_type: str) -> str:
         """Generate SEO metadata."""
+        return self._review(content, target_keywords, content_type)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _review(cls, content: str, target_keywords: str, content_type: str) -> str:
+        """Build the metadata package; deterministic, so identical requests are cached."""
         
         # Extract key information
-        title_base = self._extract_title_base(content, content_type)
-        primary_keyword = self._extract_primary_keyword(target_keywords)
+        title_base = cls._extract_title_base(content, content_type)
+        primary_keyword = cls._extract_primary_keyword(target_keywords)
         
         # Generate metadata
-        meta_titles = self._generate_meta_titles(title_base, primary_keyword, content_type)
-        meta_descriptions = self._generate_meta_descriptions(content, primary_keyword, content_type)
-        tags = self._generate_tags(target_keywords, content_type)
-        og_metadata = self._generate_og_metadata(meta_titles[0], meta_descriptions[0])
+        meta_titles = cls._generate_meta_titles(title_base, primary_keyword, content_type)
+        meta_descriptions = cls._generate_meta_descriptions(content, primary_keyword, content_type)
+        tags = cls._generate_tags(target_keywords, content_type)
+        og_metadata = cls._generate_og_metadata(meta_titles[0], meta_descriptions[0])
+        
+        title_options = "\n".join(f'{i+1}. {title} ({len(title)} chars)' for i, title in enumerate(meta_titles))
+        description_options = "\n".join(f'{i+1}. {desc} ({len(desc)} chars)' for i, desc in enumerate(meta_descriptions))
+        primary_tags = "\n".join(f'- {tag}' for tag in tags['primary'])
+        secondary_tags = "\n".join(f'- {tag}' for tag in tags['secondary'])
         
         output = f"""## SEO METADATA PACKAGE
 
@@ -388,7 +490,7 @@ class MetadataGenerator(BaseTool):
 
 ### META TITLE OPTIONS
 
-{chr(10).join(f'{i+1}. {title} ({len(title)} chars)' for i, title in enumerate(meta_titles))}
+{title_options}
 
 **Recommendation:** Option 1 - best balance of keyword placement and CTR appeal
 
@@ -396,7 +498,7 @@ class MetadataGenerator(BaseTool):
 
 ### META DESCRIPTION OPTIONS
 
-{chr(10).join(f'{i+1}. {desc} ({len(desc)} chars)' for i, desc in enumerate(meta_descriptions))}
+{description_options}
 
 **Recommendation:** Option 1 - includes primary keyword and compelling value prop
 
@@ -405,10 +507,10 @@ class MetadataGenerator(BaseTool):
 ### RECOMMENDED TAGS
 
 **Primary Tags:**
-{chr(10).join(f'- {tag}' for tag in tags['primary'])}
+{primary_tags}
 
 **Secondary Tags:**
-{chr(10).join(f'- {tag}' for tag in tags['secondary'])}
+{secondary_tags}
 
 ---
 
@@ -444,7 +546,8 @@ twitter:image: [Add relevant image URL]
 """
         return output
     
-    def _extract_title_base(self, content: str, content_type: str) -> str:
+    @staticmethod
+    def _extract_title_base(content: str, content_type: str) -> str:
         """Extract base for title from content."""
         
         # Try to find first heading
@@ -460,9 +563,10 @@ twitter:image: [Add relevant image URL]
         if sentences:
             return sentences[0][:60].strip()
         
-        return f"B2B {content_type.replace('_', ' ').title()}"
+        return f"B2B {_content_type_title(content_type)}"
     
-    def _extract_primary_keyword(self, keywords: str) -> str:
+    @staticmethod
+    def _extract_primary_keyword(keywords: str) -> str:
         """Extract primary keyword."""
         
         # Look for "Primary:" designation
@@ -477,82 +581,45 @@ twitter:image: [Add relevant image URL]
         first_keyword = keywords.split('.')[0].split(',')[0].strip()
         return first_keyword if first_keyword else "productivity solution"
     
-    def _generate_meta_titles(self, title_base: str, primary_keyword: str, content_type: str) -> List[str]:
+    @staticmethod
+    def _generate_meta_titles(title_base: str, primary_keyword: str, content_type: str) -> List[str]:
         """Generate meta title options."""
         
-        titles = []
-        
-        # Title 1: Keyword-first approach
-        if content_type == 'case_study':
-            titles.append(f"{primary_keyword.title()}: Customer Success Story")
-        elif content_type == 'white_paper':
-            titles.append(f"{primary_keyword.title()}: Complete Guide 2025")
-        elif content_type == 'pitch_deck':
-            titles.append(f"{primary_keyword.title()}: Product Overview")
-        else:
-            titles.append(f"{primary_keyword.title()}: {content_type.replace('_', ' ').title()}")
-        
-        # Title 2: Value-first approach  
-        if content_type == 'case_study':
-            titles.append(f"How TechCorp Achieved 40% Growth with {primary_keyword.title()}")
-        elif content_type == 'white_paper':
-            titles.append(f"The Ultimate {primary_keyword.title()} Strategy Guide")
-        else:
-            titles.append(f"Proven {primary_keyword.title()} Best Practices")
-        
-        # Title 3: Question approach
-        titles.append(f"Need Better {primary_keyword.title()}? See How")
+        templates = _META_TITLE_TEMPLATES.get(content_type, _DEFAULT_META_TITLE_TEMPLATES)
+        keyword = primary_keyword.title()
+        content_type_title = _content_type_title(content_type)
         
         # Ensure all titles are within 50-60 character range
-        return [title[:60] for title in titles]
+        return [
+            template.format(keyword=keyword, content_type=content_type_title)[:60]
+            for template in templates
+        ]
     
-    def _generate_meta_descriptions(self, content: str, primary_keyword: str, content_type: str) -> List[str]:
+    @staticmethod
+    def _generate_meta_descriptions(content: str, primary_keyword: str, content_type: str) -> List[str]:
         """Generate meta description options."""
         
-        descriptions = []
-        
-        # Description 1: Results-focused
-        if content_type == 'case_study':
-            descriptions.append(
-                f"Discover how leading companies use {primary_keyword} to drive measurable results. "
-                f"Real metrics, proven strategies, and actionable insights. Download now."
-            )
-        elif content_type == 'white_paper':
-            descriptions.append(
-                f"Complete guide to {primary_keyword} for B2B teams. Best practices, frameworks, "
-                f"and implementation strategies. Free download available."
-            )
-        else:
-            descriptions.append(
-                f"Learn how {primary_keyword} helps B2B teams improve efficiency and drive growth. "
-                f"Practical insights and proven strategies included."
-            )
-        
-        # Description 2: Problem-solution approach
-        descriptions.append(
-            f"Struggling with {primary_keyword}? This {content_type.replace('_', ' ')} shows "
-            f"how top performers solve common challenges and achieve 40%+ improvements."
-        )
-        
-        # Description 3: Benefit-focused
-        descriptions.append(
-            f"Unlock the full potential of {primary_keyword}. Expert insights, real examples, "
-            f"and practical frameworks to accelerate your success."
-        )
+        templates = _META_DESCRIPTION_TEMPLATES.get(content_type, _DEFAULT_META_DESCRIPTION_TEMPLATES)
+        content_type_label = content_type.replace('_', ' ')
         
         # Ensure descriptions are 150-160 characters
-        return [desc[:160] for desc in descriptions]
+        return [
+            template.format(keyword=primary_keyword, content_type=content_type_label)[:160]
+            for template in templates
+        ]
     
-    def _generate_tags(self, keywords: str, content_type: str) -> Dict[str, List[str]]:
+    @staticmethod
+    def _generate_tags(keywords: str, content_type: str) -> Dict[str, List[str]]:
         """Generate relevant tags."""
         
-        # Extract keywords into tags
-        keyword_list = keywords.replace('.', ',').split(',')
-        keyword_list = [k.strip().lower() for k in keyword_list if k.strip() and len(k.strip()) > 3]
-        
-        # Remove "primary:" and "secondary:" labels
-        keyword_list = [k.replace('primary:', '').replace('secondary:', '').strip() for k in keyword_list]
-        keyword_list = [k for k in keyword_list if k and len(k) > 3]
+        # Extract keywords into tags, removing "primary:" and "secondary:" labels
+        keyword_list = []
+        for part in keywords.replace('.', ',').split(','):
+            part = part.strip()
+            if len(part) > 3:
+                tag = part.lower().replace('primary:', '').replace('secondary:', '').strip()
+                if len(tag) > 3:
+                    keyword_list.append(tag)
         
         primary_tags = keyword_list[:5]
         
@@ -569,7 +636,8 @@ twitter:image: [Add relevant image URL]
             'secondary': secondary_tags
         }
     
-    def _generate_og_metadata(self, title: str, description: str) -> Dict[str, str]:
+    @staticmethod
+    def _generate_og_metadata(title: str, description: str) -> Dict[str, str]:
         """Generate Open Graph metadata."""
         return {
             'title': title[:60],
@@ -581,6 +649,105 @@ twitter:image: [Add relevant image URL]
 # TOOL 3: CTA Enhancer
 # =====================================================
 
+# Common CTA patterns; a sentence's CTA type is the first of these it contains
+_CTA_VERBS = ('schedule', 'contact', 'download', 'learn more', 'get started', 'request', 'book', 'try', 'see')
+
+# Only this many existing CTAs are reported
+_MAX_EXISTING_CTAS = 5
+
+# Enhanced CTA options (frozen, since every report shares them). The primary
+# options depend on the target action, the secondary option on the content type.
+_DEMO_PRIMARY_CTAS = _freeze((
+    {
+        'priority': 'Primary',
+        'text': "Schedule Your Personalized Demo",
+        'supporting_text': "See how we can help your team achieve similar results in just 30 minutes.",
+        'type': 'Button'
+    },
+    {
+        'priority': 'Primary Alternative',
+        'text': "Book a Demo Today",
+        'supporting_text': "Join 500+ companies already using our solution.",
+        'type': 'Button'
+    },
+))
+_DOWNLOAD_PRIMARY_CTAS = _freeze((
+    {
+        'priority': 'Primary',
+        'text': "Download the Complete Guide",
+        'supporting_text': "Get instant access to all strategies and frameworks.",
+        'type': 'Button'
+    },
+))
+_DEFAULT_PRIMARY_CTAS = _freeze((
+    {
+        'priority': 'Primary',
+        'text': "Get Started Today",
+        'supporting_text': "Experience the difference for yourself.",
+        'type': 'Button'
+    },
+))
+_SECONDARY_CTAS = _freeze({
+    'case_study': {
+        'priority': 'Secondary',
+        'text': "Read More Success Stories",
+        'supporting_text': "Discover how other companies are achieving results.",
+        'type': 'Text Link'
+    },
+})
+_DEFAULT_SECONDARY_CTA = _freeze({
+    'priority': 'Secondary',
+    'text': "Subscribe for More Insights",
+    'supporting_text': "Get monthly tips and best practices delivered to your inbox.",
+    'type': 'Text Link'
+})
+
+# Recommended CTA placements per content type (frozen, since every report shares them)
+_CTA_PLACEMENTS = _freeze({
+    'case_study': (
+        {
+            'location': 'After Results Section',
+            'rationale': 'Reader has just seen proof of value - high conversion intent',
+            'cta_type': 'Primary action (Schedule Demo)'
+        },
+        {
+            'location': 'End of Document',
+            'rationale': 'Final opportunity for engaged readers',
+            'cta_type': 'Primary action repeated'
+        },
+    ),
+    'white_paper': (
+        {
+            'location': 'After Executive Summary',
+            'rationale': 'Early CTA for time-constrained executives',
+            'cta_type': 'Secondary action (Download full PDF)'
+        },
+        {
+            'location': 'After Key Framework Section',
+            'rationale': 'Reader sees value, wants to implement',
+            'cta_type': 'Primary action (Schedule consultation)'
+        },
+        {
+            'location': 'Conclusion',
+            'rationale': 'Final conversion opportunity',
+            'cta_type': 'Primary action'
+        },
+    ),
+})
+_DEFAULT_CTA_PLACEMENTS = _freeze((
+    {
+        'location': 'Introduction',
+        'rationale': 'Early engagement opportunity',
+        'cta_type': 'Soft CTA (Learn more)'
+    },
+    {
+        'location': 'Conclusion',
+        'rationale': 'Final conversion point',
+        'cta_type': 'Primary action'
+    },
+))
+
+
 class CTAEnhancementInput(BaseModel):
     """Input schema for CTA Enhancer."""
     content: str = Field(..., description="Content with existing CTAs")
@@ -612,11 +779,18 @@ class CTAEnhancer(BaseTool):
     
     def _run(self, content: str, content_type: str, target_action: str) -> str:
         """Enhance CTAs for better conversion."""
+        return self._review(content, content_type, target_action)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _review(cls, content: str, content_type: str, target_action: str) -> str:
+        """Build the CTA report; deterministic, so identical analyses are cached."""
         
-        existing_ctas = self._identify_existing_ctas(content)
-        cta_analysis = self._analyze_cta_effectiveness(existing_ctas, target_action)
-        enhanced_ctas = self._generate_enhanced_ctas(target_action, content_type)
-        placement_recommendations = self._recommend_cta_placement(content, content_type)
+        target_lower = target_action.lower()
+        existing_ctas = cls._identify_existing_ctas(content)
+        cta_analysis = cls._analyze_cta_effectiveness(existing_ctas, target_lower)
+        enhanced_ctas = cls._generate_enhanced_ctas(target_lower, content_type)
+        placement_recommendations = cls._recommend_cta_placement(content, content_type)
         
         output = f"""## CTA ENHANCEMENT REPORT
 
@@ -630,25 +804,25 @@ class CTAEnhancer(BaseTool):
 
 **CTAs Found:** {len(existing_ctas)}
 
-{self._format_existing_ctas(existing_ctas, cta_analysis)}
+{cls._format_existing_ctas(existing_ctas, cta_analysis)}
 
 ---
 
 ### ENHANCED CTA OPTIONS
 
-{self._format_enhanced_ctas(enhanced_ctas)}
+{cls._format_enhanced_ctas(enhanced_ctas)}
 
 ---
 
 ### PLACEMENT RECOMMENDATIONS
 
-{self._format_placement_recommendations(placement_recommendations)}
+{cls._format_placement_recommendations(placement_recommendations)}
 
 ---
 
 ### OPTIMIZATION RECOMMENDATIONS
 
-{chr(10).join(f'{i+1}. {rec}' for i, rec in enumerate(self._generate_cta_recommendations(cta_analysis, existing_ctas, content_type)))}
+{chr(10).join(f'{i+1}. {rec}' for i, rec in enumerate(cls._generate_cta_recommendations(cta_analysis, existing_ctas, content_type)))}
 
 ---
 
@@ -657,28 +831,32 @@ class CTAEnhancer(BaseTool):
 """
         return output
     
-    def _identify_existing_ctas(self, content: str) -> List[Dict[str, str]]:
+    @staticmethod
+    def _identify_existing_ctas(content: str) -> List[Dict[str, str]]:
         """Identify existing CTAs in content."""
         
         ctas = []
         
-        # Common CTA patterns
-        cta_verbs = ['schedule', 'contact', 'download', 'learn more', 'get started', 'request', 'book', 'try', 'see']
-        
         sentences = content.split('.')
+        early_end = len(sentences) // 3
+        middle_end = 2 * len(sentences) // 3
         for i, sentence in enumerate(sentences):
             sentence_lower = sentence.lower()
-            if any(verb in sentence_lower for verb in cta_verbs):
+            cta_type = next((verb for verb in _CTA_VERBS if verb in sentence_lower), None)
+            if cta_type is not None:
                 ctas.append({
                     'text': sentence.strip(),
-                    'position': 'early' if i < len(sentences) // 3 else 'middle' if i < 2 * len(sentences) // 3 else 'end',
-                    'type': next((verb for verb in cta_verbs if verb in sentence_lower), 'other')
+                    'position': 'early' if i < early_end else 'middle' if i < middle_end else 'end',
+                    'type': cta_type
                 })
+                if len(ctas) == _MAX_EXISTING_CTAS:
+                    break
         
-        return ctas[:5]  # Max 5 CTAs
+        return ctas
     
-    def _analyze_cta_effectiveness(self, ctas: List[Dict], target_action: str) -> Dict[str, Any]:
-        """Analyze effectiveness of existing CTAs."""
+    @staticmethod
+    def _analyze_cta_effectiveness(ctas: List[Dict], target_lower: str) -> Dict[str, Any]:
+        """Analyze effectiveness of existing CTAs (target_lower is the lowercased target action)."""
         
         if not ctas:
             return {
@@ -688,12 +866,14 @@ class CTAEnhancer(BaseTool):
                 'alignment_with_goal': 'Poor'
             }
         
+        cta_texts = [cta['text'].lower() for cta in ctas]
+        
         # Check if primary action is present
-        target_keywords = target_action.lower().split()
-        has_primary = any(any(keyword in cta['text'].lower() for keyword in target_keywords[:3]) for cta in ctas)
+        target_keywords = target_lower.split()[:3]
+        has_primary = any(any(keyword in text for keyword in target_keywords) for text in cta_texts)
         
         # Check action clarity
-        action_verbs = sum(1 for cta in ctas if any(verb in cta['text'].lower() for verb in ['schedule', 'download', 'contact', 'request']))
+        action_verbs = sum(1 for text in cta_texts if any(verb in text for verb in ('schedule', 'download', 'contact', 'request')))
         action_clarity = 'Strong' if action_verbs >= len(ctas) * 0.7 else 'Moderate' if action_verbs > 0 else 'Weak'
         
         # Calculate overall score
@@ -714,148 +894,75 @@ class CTAEnhancer(BaseTool):
             'alignment_with_goal': 'Good' if has_primary else 'Needs improvement'
         }
     
-    def _generate_enhanced_ctas(self, target_action: str, content_type: str) -> List[Dict[str, str]]:
-        """Generate enhanced CTA options."""
-        
-        ctas = []
+    @staticmethod
+    def _generate_enhanced_ctas(target_lower: str, content_type: str) -> List[Mapping[str, str]]:
+        """Generate enhanced CTA options (target_lower is the lowercased target action)."""
         
         # Primary CTA
-        if 'demo' in target_action.lower():
-            ctas.append({
-                'priority': 'Primary',
-                'text': "Schedule Your Personalized Demo",
-                'supporting_text': "See how we can help your team achieve similar results in just 30 minutes.",
-                'type': 'Button'
-            })
-            ctas.append({
-                'priority': 'Primary Alternative',
-                'text': "Book a Demo Today",
-                'supporting_text': "Join 500+ companies already using our solution.",
-                'type': 'Button'
-            })
-        elif 'download' in target_action.lower():
-            ctas.append({
-                'priority': 'Primary',
-                'text': "Download the Complete Guide",
-                'supporting_text': "Get instant access to all strategies and frameworks.",
-                'type': 'Button'
-            })
+        if 'demo' in target_lower:
+            primary = _DEMO_PRIMARY_CTAS
+        elif 'download' in target_lower:
+            primary = _DOWNLOAD_PRIMARY_CTAS
         else:
-            ctas.append({
-                'priority': 'Primary',
-                'text': "Get Started Today",
-                'supporting_text': "Experience the difference for yourself.",
-                'type': 'Button'
-            })
+            primary = _DEFAULT_PRIMARY_CTAS
         
         # Secondary CTA
-        if content_type == 'case_study':
-            ctas.append({
-                'priority': 'Secondary',
-                'text': "Read More Success Stories",
-                'supporting_text': "Discover how other companies are achieving results.",
-                'type': 'Text Link'
-            })
-        else:
-            ctas.append({
-                'priority': 'Secondary',
-                'text': "Subscribe for More Insights",
-                'supporting_text': "Get monthly tips and best practices delivered to your inbox.",
-                'type': 'Text Link'
-            })
-        
-        return ctas
+        return [*primary, _SECONDARY_CTAS.get(content_type, _DEFAULT_SECONDARY_CTA)]
     
-    def _recommend_cta_placement(self, content: str, content_type: str) -> List[Dict[str, str]]:
+    @staticmethod
+    def _recommend_cta_placement(content: str, content_type: str) -> List[Mapping[str, str]]:
         """Recommend CTA placement."""
-        
-        recommendations = []
-        
-        if content_type == 'case_study':
-            recommendations.append({
-                'location': 'After Results Section',
-                'rationale': 'Reader has just seen proof of value - high conversion intent',
-                'cta_type': 'Primary action (Schedule Demo)'
-            })
-            recommendations.append({
-                'location': 'End of Document',
-                'rationale': 'Final opportunity for engaged readers',
-                'cta_type': 'Primary action repeated'
-            })
-        elif content_type == 'white_paper':
-            recommendations.append({
-                'location': 'After Executive Summary',
-                'rationale': 'Early CTA for time-constrained executives',
-                'cta_type': 'Secondary action (Download full PDF)'
-            })
-            recommendations.append({
-                'location': 'After Key Framework Section',
-                'rationale': 'Reader sees value, wants to implement',
-                'cta_type': 'Primary action (Schedule consultation)'
-            })
-            recommendations.append({
-                'location': 'Conclusion',
-                'rationale': 'Final conversion opportunity',
-                'cta_type': 'Primary action'
-            })
-        else:
-            recommendations.append({
-                'location': 'Introduction',
-                'rationale': 'Early engagement opportunity',
-                'cta_type': 'Soft CTA (Learn more)'
-            })
-            recommendations.append({
-                'location': 'Conclusion',
-                'rationale': 'Final conversion point',
-                'cta_type': 'Primary action'
-            })
-        
-        return recommendations
+        return list(_CTA_PLACEMENTS.get(content_type, _DEFAULT_CTA_PLACEMENTS))
     
-    def _format_existing_ctas(self, ctas: List[Dict], analysis: Dict) -> str:
+    @staticmethod
+    def _format_existing_ctas(ctas: List[Dict], analysis: Dict) -> str:
         """Format existing CTA analysis."""
         
         if not ctas:
             return "❌ No clear CTAs found in content\n\n**Impact:** Missing conversion opportunities"
         
-        output = ""
-        for i, cta in enumerate(ctas, 1):
-            output += f"\n**CTA #{i}:**\n"
-            output += f"- Text: \"{cta['text']}\"\n"
-            output += f"- Position: {cta['position'].title()}\n"
-            output += f"- Type: {cta['type'].title()}\n"
+        lines = [
+            f"\n**CTA #{i}:**\n"
+            f"- Text: \"{cta['text']}\"\n"
+            f"- Position: {cta['position'].title()}\n"
+            f"- Type: {cta['type'].title()}\n"
+            for i, cta in enumerate(ctas, 1)
+        ]
         
-        output += f"\n**Analysis:**\n"
-        output += f"- Primary Action Present: {'✅ Yes' if analysis['has_primary_cta'] else '❌ No'}\n"
-        output += f"- Action Clarity: {analysis['action_clarity']}\n"
-        output += f"- Goal Alignment: {analysis['alignment_with_goal']}\n"
+        lines.append(
+            "\n**Analysis:**\n"
+            f"- Primary Action Present: {'✅ Yes' if analysis['has_primary_cta'] else '❌ No'}\n"
+            f"- Action Clarity: {analysis['action_clarity']}\n"
+            f"- Goal Alignment: {analysis['alignment_with_goal']}\n"
+        )
         
-        return output
+        return ''.join(lines)
     
-    def _format_enhanced_ctas(self, ctas: List[Dict]) -> str:
+    @staticmethod
+    def _format_enhanced_ctas(ctas: List[Dict]) -> str:
         """Format enhanced CTA options."""
         
-        output = ""
-        for cta in ctas:
-            output += f"\n**{cta['priority']} CTA:**\n"
-            output += f"```\n{cta['text']}\n```\n"
-            output += f"*{cta['supporting_text']}*\n"
-            output += f"**Format:** {cta['type']}\n"
-        
-        return output
+        return ''.join(
+            f"\n**{cta['priority']} CTA:**\n"
+            f"```\n{cta['text']}\n```\n"
+            f"*{cta['supporting_text']}*\n"
+            f"**Format:** {cta['type']}\n"
+            for cta in ctas
+        )
     
-    def _format_placement_recommendations(self, recommendations: List[Dict]) -> str:
+    @staticmethod
+    def _format_placement_recommendations(recommendations: List[Dict]) -> str:
         """Format placement recommendations."""
         
-        output = ""
-        for i, rec in enumerate(recommendations, 1):
-            output += f"\n**Position #{i}: {rec['location']}**\n"
-            output += f"- Rationale: {rec['rationale']}\n"
-            output += f"- Recommended CTA: {rec['cta_type']}\n"
-        
-        return output
+        return ''.join(
+            f"\n**Position #{i}: {rec['location']}**\n"
+            f"- Rationale: {rec['rationale']}\n"
+            f"- Recommended CTA: {rec['cta_type']}\n"
+            for i, rec in enumerate(recommendations, 1)
+        )
     
-    def _generate_cta_recommendations(self, analysis: Dict, existing_ctas: List[Dict], content_type: str) -> List[str]:
+    @staticmethod
+    def _generate_cta_recommendations(analysis: Dict, existing_ctas: List[Dict], content_type: str) -> List[str]:
         """Generate CTA improvement recommendations."""
         
         recommendations = []
@@ -917,10 +1024,16 @@ class FormatOptimizer(BaseTool):
     
     def _run(self, content: str, content_type: str) -> str:
         """Optimize content formatting."""
+        return self._review(content, content_type)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _review(cls, content: str, content_type: str) -> str:
+        """Build the format report; deterministic, so identical analyses are cached."""
         
-        structure_analysis = self._analyze_structure(content)
-        readability_analysis = self._analyze_readability(content)
-        visual_suggestions = self._suggest_visual_elements(content, content_type)
+        structure_analysis = cls._analyze_structure(content)
+        readability_analysis = cls._analyze_readability(content)
+        visual_suggestions = cls._suggest_visual_elements(content, content_type)
         
         output = f"""## FORMAT OPTIMIZATION REPORT
 
@@ -932,25 +1045,25 @@ class FormatOptimizer(BaseTool):
 
 ### STRUCTURE ANALYSIS
 
-{self._format_structure_analysis(structure_analysis)}
+{cls._format_structure_analysis(structure_analysis)}
 
 ---
 
 ### READABILITY ANALYSIS
 
-{self._format_readability_analysis(readability_analysis)}
+{cls._format_readability_analysis(readability_analysis)}
 
 ---
 
 ### VISUAL ELEMENT SUGGESTIONS
 
-{self._format_visual_suggestions(visual_suggestions)}
+{cls._format_visual_suggestions(visual_suggestions)}
 
 ---
 
 ### OPTIMIZATION RECOMMENDATIONS
 
-{chr(10).join(f'{i+1}. {rec}' for i, rec in enumerate(self._generate_format_recommendations(structure_analysis, readability_analysis, content_type)))}
+{chr(10).join(f'{i+1}. {rec}' for i, rec in enumerate(cls._generate_format_recommendations(structure_analysis, readability_analysis, content_type)))}
 
 ---
 
@@ -958,15 +1071,22 @@ class FormatOptimizer(BaseTool):
 """
         return output
     
-    def _analyze_structure(self, content: str) -> Dict[str, Any]:
+    @staticmethod
+    def _analyze_structure(content: str) -> Dict[str, Any]:
         """Analyze content structure."""
         
-        lines = content.split('\n')
-        
-        # Count headings
-        h1_count = sum(1 for line in lines if line.strip().startswith('# ') and not line.startswith('##'))
-        h2_count = sum(1 for line in lines if line.strip().startswith('## '))
-        h3_count = sum(1 for line in lines if line.strip().startswith('### '))
+        # Count headings (the three prefixes are mutually exclusive)
+        h1_count = h2_count = h3_count = 0
+        for line in content.split('\n'):
+            stripped = line.strip()
+            if not stripped.startswith('#'):
+                continue
+            if stripped.startswith('# '):
+                h1_count += 1
+            elif stripped.startswith('## '):
+                h2_count += 1
+            elif stripped.startswith('### '):
+                h3_count += 1
         
         total_headings = h1_count + h2_count + h3_count
         
@@ -995,42 +1115,63 @@ class FormatOptimizer(BaseTool):
             'score': min(100, score)
         }
     
-    def _analyze_readability(self, content: str) -> Dict[str, Any]:
+    @staticmethod
+    def _analyze_readability(content: str) -> Dict[str, Any]:
         """Analyze readability factors."""
         
-        # Remove headings for paragraph analysis
-        content_no_headings = '\n'.join(line for line in content.split('\n') if not line.strip().startswith('#'))
-        
-        paragraphs = [p.strip() for p in content_no_headings.split('\n\n') if p.strip()]
+        # Check for bullet points ('- ' and '* ' lines are covered by the character checks)
+        has_bullets = '-' in content or '*' in content
+        
+        # Walk the lines once, ignoring headings: a paragraph ends at an empty line and
+        # counts only if it has words. Only running totals are kept.
+        paragraph_count = 0
+        total_words = 0
+        long_paragraphs = 0
+        paragraph_words = 0
+        for line in content.split('\n'):
+            stripped = line.strip()
+            if stripped.startswith('#'):
+                continue
+            if not line:
+                if paragraph_words:
+                    paragraph_count += 1
+                    total_words += paragraph_words
+                    if paragraph_words > 100:
+                        long_paragraphs += 1
+                    paragraph_words = 0
+                continue
+            paragraph_words += len(line.split())
+            if not has_bullets and stripped.startswith(('1.', '2.')):
+                has_bullets = True
+        if paragraph_words:
+            paragraph_count += 1
+            total_words += paragraph_words
+            if paragraph_words > 100:
+                long_paragraphs += 1
         
         # Analyze paragraph length
-        paragraph_lengths = [len(p.split()) for p in paragraphs]
-        avg_paragraph_length = sum(paragraph_lengths) / max(len(paragraphs), 1)
-        
-        long_paragraphs = sum(1 for length in paragraph_lengths if length > 100)
-        
-        # Check for bullet points
-        has_bullets = '-' in content or '*' in content or any(line.strip().startswith(('- ', '* ', '1.', '2.')) for line in content.split('\n'))
+        avg_paragraph_length = total_words / max(paragraph_count, 1)
         
         # Check for white space
         blank_lines = content.count('\n\n')
-        adequate_whitespace = blank_lines >= len(paragraphs) * 0.5
+        adequate_whitespace = blank_lines >= paragraph_count * 0.5
         
         return {
-            'paragraph_count': len(paragraphs),
+            'paragraph_count': paragraph_count,
             'avg_paragraph_length': round(avg_paragraph_length, 1),
             'long_paragraphs': long_paragraphs,
             'has_bullets': has_bullets,
             'adequate_whitespace': adequate_whitespace
         }
     
-    def _suggest_visual_elements(self, content: str, content_type: str) -> List[Dict[str, str]]:
+    @staticmethod
+    def _suggest_visual_elements(content: str, content_type: str) -> List[Dict[str, str]]:
         """Suggest visual elements to add."""
         
         suggestions = []
         
         # Check if numbers/metrics are present - suggest data visualization
-        if any(char.isdigit() for char in content) and '%' in content:
+        if '%' in content and any(map(str.isdigit, content)):
             suggestions.append({
                 'type': 'Data Visualization',
                 'element': 'Chart or infographic',
@@ -1048,7 +1189,8 @@ class FormatOptimizer(BaseTool):
             })
         
         # Suggest call-out boxes
-        if 'key' in content.lower() or 'important' in content.lower():
+        content_lower = content.lower()
+        if 'key' in content_lower or 'important' in content_lower:
             suggestions.append({
                 'type': 'Call-out Box',
                 'element': 'Highlighted key takeaway',
@@ -1067,58 +1209,61 @@ class FormatOptimizer(BaseTool):
         
         return suggestions[:4]
     
-    def _format_structure_analysis(self, analysis: Dict) -> str:
+    @staticmethod
+    def _format_structure_analysis(analysis: Dict) -> str:
         """Format structure analysis results."""
         
-        output = "**Heading Structure:**\n"
-        output += f"- H1 headings: {analysis['h1_count']}\n"
-        output += f"- H2 headings: {analysis['h2_count']}\n"
-        output += f"- H3 headings: {analysis['h3_count']}\n"
-        output += f"- Total headings: {analysis['total_headings']}\n\n"
-        
         if analysis['proper_hierarchy']:
-            output += "✅ Proper heading hierarchy maintained\n"
+            hierarchy = "✅ Proper heading hierarchy maintained"
         else:
-            output += "⚠️ Heading hierarchy needs improvement\n"
-        
-        output += f"\n**Sections:** {analysis['section_count']} content sections identified\n"
-        
-        return output
+            hierarchy = "⚠️ Heading hierarchy needs improvement"
+        
+        return (
+            "**Heading Structure:**\n"
+            f"- H1 headings: {analysis['h1_count']}\n"
+            f"- H2 headings: {analysis['h2_count']}\n"
+            f"- H3 headings: {analysis['h3_count']}\n"
+            f"- Total headings: {analysis['total_headings']}\n\n"
+            f"{hierarchy}\n"
+            f"\n**Sections:** {analysis['section_count']} content sections identified\n"
+        )
     
-    def _format_readability_analysis(self, analysis: Dict) -> str:
+    @staticmethod
+    def _format_readability_analysis(analysis: Dict) -> str:
         """Format readability analysis results."""
         
-        output = f"**Paragraph Statistics:**\n"
-        output += f"- Total paragraphs: {analysis['paragraph_count']}\n"
-        output += f"- Average length: {analysis['avg_paragraph_length']} words\n"
-        output += f"- Long paragraphs (>100 words): {analysis['long_paragraphs']}\n\n"
-        
         if analysis['avg_paragraph_length'] > 75:
-            output += "⚠️ Paragraphs are too long - break into shorter chunks\n"
+            length_verdict = "⚠️ Paragraphs are too long - break into shorter chunks"
         else:
-            output += "✅ Paragraph length is good for readability\n"
-        
-        output += f"\n{'✅' if analysis['has_bullets'] else '❌'} Bullet points: {'Present' if analysis['has_bullets'] else 'Missing'}\n"
-        output += f"{'✅' if analysis['adequate_whitespace'] else '⚠️'} White space: {'Adequate' if analysis['adequate_whitespace'] else 'Needs more'}\n"
-        
-        return output
+            length_verdict = "✅ Paragraph length is good for readability"
+        
+        return (
+            "**Paragraph Statistics:**\n"
+            f"- Total paragraphs: {analysis['paragraph_count']}\n"
+            f"- Average length: {analysis['avg_paragraph_length']} words\n"
+            f"- Long paragraphs (>100 words): {analysis['long_paragraphs']}\n\n"
+            f"{length_verdict}\n"
+            f"\n{'✅' if analysis['has_bullets'] else '❌'} Bullet points: {'Present' if analysis['has_bullets'] else 'Missing'}\n"
+            f"{'✅' if analysis['adequate_whitespace'] else '⚠️'} White space: {'Adequate' if analysis['adequate_whitespace'] else 'Needs more'}\n"
+        )
     
-    def _format_visual_suggestions(self, suggestions: List[Dict]) -> str:
+    @staticmethod
+    def _format_visual_suggestions(suggestions: List[Dict]) -> str:
         """Format visual element suggestions."""
         
         if not suggestions:
             return "No specific visual elements needed - content is primarily text-based"
         
-        output = ""
-        for i, suggestion in enumerate(suggestions, 1):
-            output += f"\n**Suggestion #{i}: {suggestion['type']}**\n"
-            output += f"- Element: {suggestion['element']}\n"
-            output += f"- Placement: {suggestion['placement']}\n"
-            output += f"- Rationale: {suggestion['rationale']}\n"
-        
-        return output
+        return ''.join(
+            f"\n**Suggestion #{i}: {suggestion['type']}**\n"
+            f"- Element: {suggestion['element']}\n"
+            f"- Placement: {suggestion['placement']}\n"
+            f"- Rationale: {suggestion['rationale']}\n"
+            for i, suggestion in enumerate(suggestions, 1)
+        )
     
-    def _generate_format_recommendations(self, structure: Dict, readability: Dict, content_type: str) -> List[str]:
+    @staticmethod
+    def _generate_format_recommendations(structure: Dict, readability: Dict, content_type: str) -> List[str]:
         """Generate format optimization recommendations."""
         
         recommendations = []
@@ -0,0 +1,86 @@
+"""
+Unit tests for the Pitch Deck tools
+Tests that the slide outline reflects the persona, product and sales inputs
+"""
+
+import unittest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from b2b_content_agent.tools.pitch_deck_tools import SlideOutlineGenerator
+
+
+PERSONA = "Director of Marketing at B2B SaaS companies, 100-500 employees"
+PRODUCT = "Marketing automation platform with AI-powered lead scoring"
+SALES = "Mid-stage enterprise deal, presenting to the budget holder"
+
+
+def slide_block(outline, number):
+    """Return the text of one slide, from its heading to the next separator"""
+    start = outline.index(f"#### Slide {number}:")
+    return outline[start:outline.index("\n---\n", start)]
+
+
+class TestSlideOutlineGenerator(unittest.TestCase):
+    """Test SlideOutlineGenerator input handling"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tool = SlideOutlineGenerator()
+
+    def test_context_header_shows_summaries(self):
+        """Test the presentation context lists all three inputs"""
+        outline = self.tool._run(PERSONA, PRODUCT, SALES)
+
+        self.assertIn(f"**Audience:** {PERSONA}\n", outline)
+        self.assertIn(f"**Offering:** {PRODUCT}\n", outline)
+        self.assertIn(f"**Sales Context:** {SALES}\n", outline)
+
+    def test_talking_points_follow_inputs(self):
+        """Test slides 2, 5 and 11 gain a talking point only for non-empty input"""
+        outline = self.tool._run(PERSONA, PRODUCT, SALES)
+
+        self.assertIn(f"- Ground the scenario in this audience: {PERSONA}", slide_block(outline, 2))
+        self.assertIn(f"- Anchor the walkthrough in the offering: {PRODUCT}", slide_block(outline, 5))
+        self.assertIn(f"- Frame the rollout around the deal context: {SALES}", slide_block(outline, 11))
+
+        outline = self.tool._run(PERSONA, "", "")
+
+        self.assertIn("Ground the scenario in this audience", slide_block(outline, 2))
+        self.assertNotIn("Anchor the walkthrough", outline)
+        self.assertNotIn("Frame the rollout", outline)
+
+    def test_empty_inputs_not_specified(self):
+        """Test empty inputs are reported as not specified"""
+        outline = self.tool._run("", "   ", "")
+
+        self.assertIn("**Audience:** Not specified\n", outline)
+        self.assertIn("**Offering:** Not specified\n", outline)
+        self.assertIn("**Sales Context:** Not specified\n", outline)
+        self.assertNotIn("Ground the scenario", outline)
+
+    def test_braces_pass_through(self):
+        """Test braces in input are not treated as format fields"""
+        outline = self.tool._run("VP {0} of {persona_summary}", PRODUCT, "Q{4} deal }{")
+
+        self.assertIn("**Audience:** VP {0} of {persona_summary}\n", outline)
+        self.assertIn("**Sales Context:** Q{4} deal }{\n", outline)
+        self.assertIn("- Ground the scenario in this audience: VP {0} of {persona_summary}", slide_block(outline, 2))
+
+    def test_long_input_truncated(self):
+        """Test long input is trimmed on a word boundary with an ellipsis"""
+        persona = " ".join(["procurement"] * 40)
+        outline = self.tool._run(persona, PRODUCT, SALES)
+
+        audience = outline.split("**Audience:** ", 1)[1].split("\n", 1)[0]
+        self.assertTrue(audience.endswith("..."))
+        self.assertLessEqual(len(audience), 200 + len("..."))
+        self.assertTrue(persona.startswith(audience[:-3]))
+        self.assertTrue(audience[:-3].endswith("procurement"))
+        self.assertIn(f"- Ground the scenario in this audience: {audience}", slide_block(outline, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+"""
+Unit tests for the Product Analysis tools
+Tests section and bullet extraction in ProductAnalyzerTool
+"""
+
+import unittest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from b2b_content_agent.tools.product_analysis_tools import ProductAnalyzerTool
+
+
+class TestProductAnalyzerSections(unittest.TestCase):
+    """Test ProductAnalyzerTool section extraction"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tool = ProductAnalyzerTool()
+
+    def test_overlapping_heading_listed_once(self):
+        """Test a heading matched by two section patterns lists its bullets once"""
+        report = self.tool._run("Acme Sync\n\nKey Features:\n- Real-time sync\n- Offline mode\n")
+
+        self.assertIn("FEATURES:\n  1. Real-time sync\n  2. Offline mode\n", report)
+        self.assertNotIn("  3.", report)
+
+    def test_heading_word_inside_bullet_is_not_a_section(self):
+        """Test a bullet ending in a heading word does not open a new section"""
+        report = self.tool._run("Acme Sync\n\nFeatures:\n- Core value\n- Fast sync\n")
+
+        self.assertIn("FEATURES:\n  1. Core value\n  2. Fast sync\n", report)
+        self.assertNotIn("BENEFITS:", report)
+
+    def test_repeated_bullets_deduplicated(self):
+        """Test bullets repeated within a section are listed once, in first-seen order"""
+        report = self.tool._run(
+            "Acme Sync\n\nBenefits:\n- Saves time\n- Cuts cost\n- Saves time\n- Fewer errors\n"
+        )
+
+        self.assertIn("BENEFITS:\n  1. Saves time\n  2. Cuts cost\n  3. Fewer errors\n", report)
+        self.assertNotIn("  4.", report)
+
+
+if __name__ == "__main__":
+    unittest.main()